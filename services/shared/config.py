@@ -29,6 +29,11 @@ class SharedSettings(BaseSettings):
     POSTGRES_DB: str = "annadata"
     POSTGRES_PORT: str = "5432"
 
+    # Connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
@@ -36,6 +41,7 @@ class SharedSettings(BaseSettings):
 
     # AI
     NVIDIA_API_KEY: Optional[str] = None
+    SOILSCAN_MODEL_PATH: Optional[str] = None  # joblib artifact loaded by Celery workers
 
     # JWT
     JWT_SECRET_KEY: str = "insecure-jwt-secret-change-in-production"
@@ -35,8 +35,9 @@ def get_engine() -> AsyncEngine:
         _engine = create_async_engine(
             settings.DATABASE_URL,
             echo=settings.DEBUG,
-            pool_size=20,
-            max_overflow=10,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_recycle=settings.DB_POOL_RECYCLE,
             pool_pre_ping=True,
         )
     return _engine
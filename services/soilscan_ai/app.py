@@ -10,16 +10,26 @@ without an external database.
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import hashlib
+import math
+import time
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Literal
 
 import numpy as np
+import orjson
 import uvicorn
-from fastapi import Depends, FastAPI, HTTPException, Query, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from limits import parse as parse_rate_limit
 from pydantic import BaseModel, Field
+from slowapi.util import get_remote_address
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -28,7 +38,11 @@ import json
 from openai import OpenAI
 from .serial_service import serial_service
 
-from services.shared.auth.router import router as auth_router, setup_rate_limiting
+from services.shared.auth.router import (
+    limiter,
+    router as auth_router,
+    setup_rate_limiting,
+)
 from services.shared.config import settings
 from services.shared.db.session import close_db, init_db, get_db
 from services.shared.db.models import SoilAnalysis
@@ -59,6 +73,24 @@ _WEIGHTS: dict[str, float] = {
     "moisture_pct": 0.15,
 }
 
+# Positional views of the tables above, built once so scoring indexes
+# tuples instead of doing dict lookups and array construction per sample.
+_KEYS: tuple[str, ...] = tuple(_OPTIMAL_RANGES)
+_OPTIMAL_PAIRS: tuple[tuple[float, float], ...] = tuple(
+    _OPTIMAL_RANGES[k] for k in _KEYS
+)
+# Gaussian decay width per metric: half the optimal range width, floored
+# to avoid division by zero.
+_SIGMAS: tuple[float, ...] = tuple(
+    max((high - low) / 2.0, 1e-6) for low, high in _OPTIMAL_PAIRS
+)
+_WEIGHTS_ARR = np.array([_WEIGHTS[k] for k in _KEYS], dtype=np.float64)
+
+# Batch analysis limits: hard cap per request, plus a per-client budget
+# charged per *sample* so one large batch costs as much as many small ones.
+_BATCH_MAX_SAMPLES = 1000
+_BATCH_SAMPLE_RATE = parse_rate_limit("5000/minute")
+
 # Fertility classification thresholds
 _FERTILITY_THRESHOLDS: list[tuple[float, str]] = [
     (80.0, "excellent"),
@@ -153,7 +185,7 @@ class HistoryResponse(BaseModel):
 class BatchAnalyzeRequest(BaseModel):
     """Wrapper for batch analysis."""
 
-    samples: list[SoilSampleRequest]
+    samples: list[SoilSampleRequest] = Field(max_length=_BATCH_MAX_SAMPLES)
 
 
 class BatchAnalyzeResponse(BaseModel):
@@ -321,12 +353,47 @@ class QuantumCorrelationResponse(BaseModel):
     analyzed_at: str
 
 
+# ===================================================================
+# Identifiers & timestamps
+# ===================================================================
+
+
+@lru_cache(maxsize=2)
+def _iso_now_cached(sec: int) -> str:
+    """ISO-8601 UTC timestamp for a Unix second, formatted once per second."""
+    return datetime.fromtimestamp(sec, tz=timezone.utc).isoformat()
+
+
+def _iso_now() -> str:
+    """Current UTC time as ISO-8601, at one-second resolution."""
+    return _iso_now_cached(int(time.time()))
+
+
+def _uuid7() -> uuid.UUID:
+    """
+    Generate a UUIDv7 (RFC 9562): 48-bit Unix millisecond timestamp
+    followed by 74 random bits.
+
+    IDs sort by creation time at millisecond granularity, so inserts into
+    the ``analysis_id`` index land on its rightmost leaf instead of
+    scattering like UUID4 does.  IDs created within the same millisecond
+    are ordered randomly.
+    """
+    unix_ms = time.time_ns() // 1_000_000
+    value = (unix_ms & 0xFFFF_FFFF_FFFF) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 # ===================================================================
 # Scoring helpers (numpy-based)
 # ===================================================================
 
 
-def _range_score(value: float, low: float, high: float) -> float:
+def _range_score(
+    value: float, low: float, high: float, sigma: float | None = None
+) -> float:
     """
     Score a value against an optimal [low, high] range.
 
@@ -335,13 +402,14 @@ def _range_score(value: float, low: float, high: float) -> float:
     values far from optimal score close to 0.
 
     The decay width (sigma) is set to half the range width, giving a
-    reasonable falloff for agricultural metrics.
+    reasonable falloff for agricultural metrics.  Callers scoring one of
+    the standard metrics pass the precomputed value from ``_SIGMAS``.
     """
     if low <= value <= high:
         return 100.0
 
-    midpoint = (low + high) / 2.0
-    sigma = max((high - low) / 2.0, 1e-6)  # avoid division by zero
+    if sigma is None:
+        sigma = max((high - low) / 2.0, 1e-6)  # avoid division by zero
 
     # Distance from nearest edge of the optimal range
     if value < low:
@@ -349,9 +417,24 @@ def _range_score(value: float, low: float, high: float) -> float:
     else:
         distance = value - high
 
-    # Gaussian decay from 100
-    score = float(100.0 * np.exp(-0.5 * (distance / sigma) ** 2))
-    return round(score, 2)
+    # Gaussian decay from 100, rounded half-up to 2 decimals (score >= 0)
+    score = 100.0 * math.exp(-0.5 * (distance / sigma) ** 2)
+    return int(score * 100.0 + 0.5) / 100.0
+
+
+def _score_metrics(values: tuple[float, ...]) -> tuple[list[float], float]:
+    """
+    Score readings given in ``_KEYS`` order.
+
+    Returns the per-metric scores (same order) and the weighted health
+    score clipped to 0-100.
+    """
+    scores = [
+        _range_score(value, low, high, sigma)
+        for value, (low, high), sigma in zip(values, _OPTIMAL_PAIRS, _SIGMAS)
+    ]
+    health_score = float(np.dot(_WEIGHTS_ARR, scores))
+    return scores, float(np.round(min(max(health_score, 0.0), 100.0), 2))
 
 
 def _classify_fertility(score: float) -> str:
@@ -362,259 +445,163 @@ def _classify_fertility(score: float) -> str:
     return "poor"  # fallback
 
 
-def _nutrient_status(
-    value: float, low: float, high: float
-) -> Literal["deficient", "optimal", "excess"]:
-    """Classify a nutrient value relative to its optimal range."""
-    if value < low:
-        return "deficient"
-    if value > high:
-        return "excess"
-    return "optimal"
+# Recommendation specs, one row per nutrient in output order:
+# (nutrient, sample field, low, high, deficient template, excess template,
+#  prebuilt optimal recommendation).  Templates are formatted with the
+# measured value ``v``; a ``None`` excess template means the nutrient has
+# no upper bound.
+_REC_SPECS: tuple[
+    tuple[str, str, float, float, str, str | None, Recommendation], ...
+] = (
+    (
+        "nitrogen",
+        "nitrogen_ppm",
+        250.0,
+        500.0,
+        "Nitrogen is low at {v:.1f} ppm (optimal 250-500 ppm). "
+        "Apply urea or ammonium sulphate, or rotate with nitrogen-fixing legumes.",
+        "Nitrogen is high at {v:.1f} ppm. "
+        "Reduce nitrogenous fertilizer to avoid leaf burn and groundwater contamination.",
+        Recommendation(
+            nutrient="nitrogen",
+            status="optimal",
+            message="Nitrogen levels are within the optimal range.",
+        ),
+    ),
+    (
+        "phosphorus",
+        "phosphorus_ppm",
+        15.0,
+        30.0,
+        "Phosphorus is low at {v:.1f} ppm (optimal 15-30 ppm). "
+        "Apply single super phosphate (SSP) or DAP.",
+        "Phosphorus is high at {v:.1f} ppm. "
+        "Avoid further phosphatic fertilizer to prevent nutrient lock-out.",
+        Recommendation(
+            nutrient="phosphorus",
+            status="optimal",
+            message="Phosphorus levels are within the optimal range.",
+        ),
+    ),
+    (
+        "potassium",
+        "potassium_ppm",
+        120.0,
+        250.0,
+        "Potassium is low at {v:.1f} ppm (optimal 120-250 ppm). "
+        "Apply muriate of potash (MOP) or sulphate of potash.",
+        "Potassium is high at {v:.1f} ppm. "
+        "Reduce potassium inputs; excess K can inhibit magnesium uptake.",
+        Recommendation(
+            nutrient="potassium",
+            status="optimal",
+            message="Potassium levels are within the optimal range.",
+        ),
+    ),
+    (
+        "ph",
+        "ph_level",
+        6.5,
+        7.0,
+        "Soil pH is acidic at {v:.1f} (optimal 6.5-7.0). "
+        "Apply agricultural lime to raise pH.",
+        "Soil pH is alkaline at {v:.1f} (optimal 6.5-7.0). "
+        "Apply gypsum or sulphur to lower pH.",
+        Recommendation(
+            nutrient="ph",
+            status="optimal",
+            message="Soil pH is within the ideal range.",
+        ),
+    ),
+    (
+        "organic_carbon",
+        "organic_carbon_pct",
+        0.75,
+        math.inf,
+        "Organic carbon is low at {v:.2f}% (target ≥0.75%). "
+        "Incorporate compost, green manure, or crop residues.",
+        None,
+        Recommendation(
+            nutrient="organic_carbon",
+            status="optimal",
+            message="Organic carbon levels are adequate.",
+        ),
+    ),
+    (
+        "moisture",
+        "moisture_pct",
+        20.0,
+        40.0,
+        "Soil moisture is low at {v:.1f}% (optimal 20-40%). "
+        "Increase irrigation frequency or apply mulch to retain moisture.",
+        "Soil moisture is high at {v:.1f}% (optimal 20-40%). "
+        "Improve drainage to prevent waterlogging and root rot.",
+        Recommendation(
+            nutrient="moisture",
+            status="optimal",
+            message="Soil moisture is within the optimal range.",
+        ),
+    ),
+)
 
 
 def _build_recommendations(sample: SoilSampleRequest) -> list[Recommendation]:
     """Generate actionable recommendations from nutrient readings."""
     recs: list[Recommendation] = []
-
-    # --- Nitrogen ---
-    n_status = _nutrient_status(sample.nitrogen_ppm, 250.0, 500.0)
-    if n_status == "deficient":
-        recs.append(
-            Recommendation(
-                nutrient="nitrogen",
-                status="deficient",
-                message=(
-                    f"Nitrogen is low at {sample.nitrogen_ppm:.1f} ppm (optimal 250-500 ppm). "
-                    "Apply urea or ammonium sulphate, or rotate with nitrogen-fixing legumes."
-                ),
+    for nutrient, field, low, high, deficient_tmpl, excess_tmpl, optimal in _REC_SPECS:
+        value = getattr(sample, field)
+        if value < low:
+            recs.append(
+                Recommendation.model_construct(
+                    nutrient=nutrient,
+                    status="deficient",
+                    message=deficient_tmpl.format(v=value),
+                )
             )
-        )
-    elif n_status == "excess":
-        recs.append(
-            Recommendation(
-                nutrient="nitrogen",
-                status="excess",
-                message=(
-                    f"Nitrogen is high at {sample.nitrogen_ppm:.1f} ppm. "
-                    "Reduce nitrogenous fertilizer to avoid leaf burn and groundwater contamination."
-                ),
-            )
-        )
-    else:
-        recs.append(
-            Recommendation(
-                nutrient="nitrogen",
-                status="optimal",
-                message="Nitrogen levels are within the optimal range.",
+        elif value > high:
+            recs.append(
+                Recommendation.model_construct(
+                    nutrient=nutrient,
+                    status="excess",
+                    message=excess_tmpl.format(v=value),
+                )
             )
-        )
-
-    # --- Phosphorus ---
-    p_status = _nutrient_status(sample.phosphorus_ppm, 15.0, 30.0)
-    if p_status == "deficient":
-        recs.append(
-            Recommendation(
-                nutrient="phosphorus",
-                status="deficient",
-                message=(
-                    f"Phosphorus is low at {sample.phosphorus_ppm:.1f} ppm (optimal 15-30 ppm). "
-                    "Apply single super phosphate (SSP) or DAP."
-                ),
-            )
-        )
-    elif p_status == "excess":
-        recs.append(
-            Recommendation(
-                nutrient="phosphorus",
-                status="excess",
-                message=(
-                    f"Phosphorus is high at {sample.phosphorus_ppm:.1f} ppm. "
-                    "Avoid further phosphatic fertilizer to prevent nutrient lock-out."
-                ),
-            )
-        )
-    else:
-        recs.append(
-            Recommendation(
-                nutrient="phosphorus",
-                status="optimal",
-                message="Phosphorus levels are within the optimal range.",
-            )
-        )
-
-    # --- Potassium ---
-    k_status = _nutrient_status(sample.potassium_ppm, 120.0, 250.0)
-    if k_status == "deficient":
-        recs.append(
-            Recommendation(
-                nutrient="potassium",
-                status="deficient",
-                message=(
-                    f"Potassium is low at {sample.potassium_ppm:.1f} ppm (optimal 120-250 ppm). "
-                    "Apply muriate of potash (MOP) or sulphate of potash."
-                ),
-            )
-        )
-    elif k_status == "excess":
-        recs.append(
-            Recommendation(
-                nutrient="potassium",
-                status="excess",
-                message=(
-                    f"Potassium is high at {sample.potassium_ppm:.1f} ppm. "
-                    "Reduce potassium inputs; excess K can inhibit magnesium uptake."
-                ),
-            )
-        )
-    else:
-        recs.append(
-            Recommendation(
-                nutrient="potassium",
-                status="optimal",
-                message="Potassium levels are within the optimal range.",
-            )
-        )
-
-    # --- pH ---
-    if sample.ph_level < 6.5:
-        recs.append(
-            Recommendation(
-                nutrient="ph",
-                status="deficient",
-                message=(
-                    f"Soil pH is acidic at {sample.ph_level:.1f} (optimal 6.5-7.0). "
-                    "Apply agricultural lime to raise pH."
-                ),
-            )
-        )
-    elif sample.ph_level > 7.0:
-        recs.append(
-            Recommendation(
-                nutrient="ph",
-                status="excess",
-                message=(
-                    f"Soil pH is alkaline at {sample.ph_level:.1f} (optimal 6.5-7.0). "
-                    "Apply gypsum or sulphur to lower pH."
-                ),
-            )
-        )
-    else:
-        recs.append(
-            Recommendation(
-                nutrient="ph",
-                status="optimal",
-                message="Soil pH is within the ideal range.",
-            )
-        )
-
-    # --- Organic carbon ---
-    if sample.organic_carbon_pct < 0.75:
-        recs.append(
-            Recommendation(
-                nutrient="organic_carbon",
-                status="deficient",
-                message=(
-                    f"Organic carbon is low at {sample.organic_carbon_pct:.2f}% (target ≥0.75%). "
-                    "Incorporate compost, green manure, or crop residues."
-                ),
-            )
-        )
-    else:
-        recs.append(
-            Recommendation(
-                nutrient="organic_carbon",
-                status="optimal",
-                message="Organic carbon levels are adequate.",
-            )
-        )
-
-    # --- Moisture ---
-    if sample.moisture_pct < 20.0:
-        recs.append(
-            Recommendation(
-                nutrient="moisture",
-                status="deficient",
-                message=(
-                    f"Soil moisture is low at {sample.moisture_pct:.1f}% (optimal 20-40%). "
-                    "Increase irrigation frequency or apply mulch to retain moisture."
-                ),
-            )
-        )
-    elif sample.moisture_pct > 40.0:
-        recs.append(
-            Recommendation(
-                nutrient="moisture",
-                status="excess",
-                message=(
-                    f"Soil moisture is high at {sample.moisture_pct:.1f}% (optimal 20-40%). "
-                    "Improve drainage to prevent waterlogging and root rot."
-                ),
-            )
-        )
-    else:
-        recs.append(
-            Recommendation(
-                nutrient="moisture",
-                status="optimal",
-                message="Soil moisture is within the optimal range.",
-            )
-        )
-
+        else:
+            recs.append(optimal)
     return recs
 
 
-async def _run_analysis(
-    sample: SoilSampleRequest
-) -> SoilAnalysisResponse:
+def _score_sample(sample: SoilSampleRequest) -> SoilAnalysisResponse:
     """
-    Core analysis pipeline.
+    Core analysis pipeline (CPU-only, safe to run in a worker thread).
 
     1. Compute individual metric scores using numpy.
     2. Compute weighted aggregate health score.
     3. Classify fertility.
     4. Generate recommendations.
-    5. Persist in the in-memory store.
     """
-    analysis_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat()
+    analysis_id = str(_uuid7())
+    now = _iso_now()
 
-    # --- Individual scores ---
-    values = np.array(
-        [
+    # --- Individual scores & weighted aggregate ---
+    scores, health_score = _score_metrics(
+        (
             sample.ph_level,
             sample.nitrogen_ppm,
             sample.phosphorus_ppm,
             sample.potassium_ppm,
             sample.organic_carbon_pct,
             sample.moisture_pct,
-        ]
+        )
     )
-
-    keys = [
-        "ph",
-        "nitrogen_ppm",
-        "phosphorus_ppm",
-        "potassium_ppm",
-        "organic_carbon_pct",
-        "moisture_pct",
-    ]
-
-    scores: dict[str, float] = {}
-    for key, val in zip(keys, values):
-        low, high = _OPTIMAL_RANGES[key]
-        scores[key] = _range_score(float(val), low, high)
-
-    # --- Weighted aggregate ---
-    weights = np.array([_WEIGHTS[k] for k in keys])
-    score_arr = np.array([scores[k] for k in keys])
-    health_score = float(np.dot(weights, score_arr))
-    health_score = round(np.clip(health_score, 0.0, 100.0), 2)
+    ph_score, n_score, p_score, k_score, oc_score, moisture_score = scores
 
     fertility_class = _classify_fertility(health_score)
     recommendations = _build_recommendations(sample)
 
-    result = SoilAnalysisResponse(
+    # Every field below is produced internally from an already-validated
+    # SoilSampleRequest, so skip re-running the response validators.
+    result = SoilAnalysisResponse.model_construct(
         analysis_id=analysis_id,
         plot_id=sample.plot_id,
         latitude=sample.latitude,
@@ -627,23 +614,33 @@ async def _run_analysis(
         ph_level=sample.ph_level,
         organic_carbon_pct=sample.organic_carbon_pct,
         moisture_pct=sample.moisture_pct,
-        ph_score=scores["ph"],
-        nitrogen_score=scores["nitrogen_ppm"],
-        phosphorus_score=scores["phosphorus_ppm"],
-        potassium_score=scores["potassium_ppm"],
-        organic_carbon_score=scores["organic_carbon_pct"],
-        moisture_score=scores["moisture_pct"],
+        ph_score=ph_score,
+        nitrogen_score=n_score,
+        phosphorus_score=p_score,
+        potassium_score=k_score,
+        organic_carbon_score=oc_score,
+        moisture_score=moisture_score,
         health_score=health_score,
         fertility_class=fertility_class,
         recommendations=recommendations,
         analyzed_at=now,
     )
 
-    # Persistence disabled for Demo Mode
-
     return result
 
 
+def _score_samples_sync(
+    samples: list[SoilSampleRequest],
+) -> list[SoilAnalysisResponse]:
+    """Score a batch of samples; run via ``asyncio.to_thread`` from handlers."""
+    return [_score_sample(sample) for sample in samples]
+
+
+async def _run_analysis(sample: SoilSampleRequest) -> SoilAnalysisResponse:
+    """Analyze a single sample.  Persistence is disabled for Demo Mode."""
+    return _score_sample(sample)
+
+
 # ===================================================================
 # Trend calculation
 # ===================================================================
@@ -856,30 +853,15 @@ async def _run_photo_analysis(
     req: SoilPhotoRequest, db: AsyncSession
 ) -> SoilPhotoResponse:
     """Full pipeline for photo-based soil analysis."""
-    analysis_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat()
+    analysis_id = str(_uuid7())
+    now = _iso_now()
 
     features = _extract_image_features(req)
     predicted = _predict_from_features(features)
 
     # Reuse the existing scoring engine
-    keys = [
-        "ph",
-        "nitrogen_ppm",
-        "phosphorus_ppm",
-        "potassium_ppm",
-        "organic_carbon_pct",
-        "moisture_pct",
-    ]
-    scores: dict[str, float] = {}
-    for key in keys:
-        low, high = _OPTIMAL_RANGES[key]
-        scores[key] = _range_score(predicted[key], low, high)
-
-    weights = np.array([_WEIGHTS[k] for k in keys])
-    score_arr = np.array([scores[k] for k in keys])
-    health_score = float(np.dot(weights, score_arr))
-    health_score = round(np.clip(health_score, 0.0, 100.0), 2)
+    scores, health_score = _score_metrics(tuple(predicted[k] for k in _KEYS))
+    ph_score, n_score, p_score, k_score, oc_score, moisture_score = scores
     fertility_class = _classify_fertility(health_score)
 
     # Build recommendations via a synthetic SoilSampleRequest
@@ -925,12 +907,12 @@ async def _run_photo_analysis(
         predicted_potassium_ppm=predicted["potassium_ppm"],
         predicted_organic_carbon_pct=predicted["organic_carbon_pct"],
         predicted_moisture_pct=predicted["moisture_pct"],
-        ph_score=scores["ph"],
-        nitrogen_score=scores["nitrogen_ppm"],
-        phosphorus_score=scores["phosphorus_ppm"],
-        potassium_score=scores["potassium_ppm"],
-        organic_carbon_score=scores["organic_carbon_pct"],
-        moisture_score=scores["moisture_pct"],
+        ph_score=ph_score,
+        nitrogen_score=n_score,
+        phosphorus_score=p_score,
+        potassium_score=k_score,
+        organic_carbon_score=oc_score,
+        moisture_score=moisture_score,
         health_score=health_score,
         fertility_class=fertility_class,
         image_features=features,
@@ -1306,8 +1288,8 @@ def _run_quantum_correlation(
     req: QuantumCorrelationRequest,
 ) -> QuantumCorrelationResponse:
     """Full pipeline for quantum-inspired correlation analysis."""
-    analysis_id = str(uuid.uuid4())
-    now = datetime.now(timezone.utc).isoformat()
+    analysis_id = str(_uuid7())
+    now = _iso_now()
 
     values = np.array(
         [
@@ -1356,11 +1338,82 @@ def _run_quantum_correlation(
 # ===================================================================
 
 
+# /health and / bodies are prebuilt bytes so probes skip datetime
+# formatting and JSON encoding.  The health timestamp is refreshed once a
+# second by a background task started in ``lifespan``, and on demand by
+# /health when that task is not running.
+_ROOT_BYTES = orjson.dumps(
+    {
+        "service": "SoilScan AI",
+        "version": "1.0.0",
+        "features": [
+            "Satellite imagery-based soil analysis",
+            "IoT sensor data integration",
+            "Soil nutrient profiling and recommendations",
+            "Historical soil health trend tracking",
+            "Batch analysis for multi-plot fields",
+        ],
+    }
+)
+_ROOT_ETAG = f'"{hashlib.sha256(_ROOT_BYTES).hexdigest()[:16]}"'
+
+# Cache-Control values per GET endpoint.  The root payload only changes on
+# deploy; health is kept short so probes still see a fresh status.
+# History is per-caller data, so shared caches must not store it.
+_ROOT_CACHE_CONTROL = "public, max-age=3600"
+_HEALTH_CACHE_CONTROL = "public, max-age=5"
+_HISTORY_CACHE_CONTROL = "private, max-age=60"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak If-None-Match comparison (RFC 9110 section 13.1.2)."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def _build_health_bytes() -> bytes:
+    """Serialize the /health payload with the current UTC timestamp."""
+    return orjson.dumps(
+        {
+            "service": "soilscan_ai",
+            "status": "healthy",
+            "timestamp": _iso_now(),
+        }
+    )
+
+
+_HEALTH_REFRESH_SECONDS = 1.0
+_health_bytes = _build_health_bytes()
+_health_built_at = time.monotonic()
+
+
+def _rebuild_health_bytes() -> None:
+    global _health_bytes, _health_built_at
+    _health_bytes = _build_health_bytes()
+    _health_built_at = time.monotonic()
+
+
+async def _refresh_health_bytes() -> None:
+    """Rebuild the cached /health body every second."""
+    while True:
+        await asyncio.sleep(_HEALTH_REFRESH_SECONDS)
+        _rebuild_health_bytes()
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan - Database initialization bypassed for Demo Mode."""
     # await init_db()
+    health_task = asyncio.create_task(_refresh_health_bytes())
     yield
+    health_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await health_task
     # await close_db()
 
 
@@ -1369,6 +1422,7 @@ app = FastAPI(
     description="Analyzes soil health using satellite imagery and sensor data",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -1393,27 +1447,24 @@ setup_rate_limiting(app)
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "service": "soilscan_ai",
-        "status": "healthy",
-        "timestamp": datetime.now(timezone.utc).isoformat(),
-    }
+    # Without lifespan (e.g. ASGI test transports) the refresh task never
+    # runs, so rebuild on demand once the cached body is stale.
+    if time.monotonic() - _health_built_at > _HEALTH_REFRESH_SECONDS:
+        _rebuild_health_bytes()
+    return Response(
+        _health_bytes,
+        media_type="application/json",
+        headers={"Cache-Control": _HEALTH_CACHE_CONTROL},
+    )
 
 
 @app.get("/")
-async def root():
+async def root(request: Request):
     """Root endpoint returning service info."""
-    return {
-        "service": "SoilScan AI",
-        "version": "1.0.0",
-        "features": [
-            "Satellite imagery-based soil analysis",
-            "IoT sensor data integration",
-            "Soil nutrient profiling and recommendations",
-            "Historical soil health trend tracking",
-            "Batch analysis for multi-plot fields",
-        ],
-    }
+    headers = {"Cache-Control": _ROOT_CACHE_CONTROL, "ETag": _ROOT_ETAG}
+    if _etag_matches(request.headers.get("if-none-match"), _ROOT_ETAG):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(_ROOT_BYTES, media_type="application/json", headers=headers)
 
 
 # -------------------------------------------------------------------
@@ -1440,13 +1491,30 @@ async def analyze_soil(sample: SoilSampleRequest):
     response_model=BatchAnalyzeResponse,
     status_code=status.HTTP_201_CREATED,
 )
-async def batch_analyze(body: BatchAnalyzeRequest):
+async def batch_analyze(request: Request, body: BatchAnalyzeRequest):
     """
     Analyze multiple soil samples in one request.
+
+    Each sample is charged against the caller's per-IP sample budget.
+    Scoring runs in a worker thread so a large batch does not block the
+    event loop for other requests.
     """
-    results = []
-    for sample in body.samples:
-        results.append(await _run_analysis(sample))
+    client_key = get_remote_address(request)
+    if limiter.enabled and not limiter.limiter.hit(
+        _BATCH_SAMPLE_RATE,
+        "batch-analyze",
+        client_key,
+        cost=len(body.samples),
+    ):
+        reset_at = limiter.limiter.get_window_stats(
+            _BATCH_SAMPLE_RATE, "batch-analyze", client_key
+        ).reset_time
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Rate limit exceeded: sample budget of {_BATCH_SAMPLE_RATE}",
+            headers={"Retry-After": str(max(1, math.ceil(reset_at - time.time())))},
+        )
+    results = await asyncio.to_thread(_score_samples_sync, body.samples)
     return BatchAnalyzeResponse(results=results, count=len(results))
 
 
@@ -1460,11 +1528,13 @@ async def get_report(analysis_id: str):
 
 @app.get("/history", response_model=HistoryResponse)
 async def get_analysis_history(
+    response: Response,
     plot_id: str = Query(..., description="Plot ID to retrieve history for"),
 ):
     """
     In-memory history retrieval not implemented in Demo Mode.
     """
+    response.headers["Cache-Control"] = _HISTORY_CACHE_CONTROL
     return HistoryResponse(plot_id=plot_id, analyses=[], trend="insufficient_data")
 
 
@@ -1557,8 +1627,8 @@ async def live_scan(req: LiveScanRequest):
        values based on moisture and location.
     3. Runs the standard scoring and recommendation pipeline.
     """
-    # 1. Capture real moisture from HW-080
-    moisture = serial_service.get_moisture()
+    # 1. Capture real moisture from HW-080 (blocking serial I/O, off the loop)
+    moisture = await asyncio.to_thread(serial_service.get_moisture)
     if moisture is None:
         raise HTTPException(
             status_code=503, 
@@ -1602,7 +1672,8 @@ async def live_scan(req: LiveScanRequest):
     """
 
     try:
-        completion = client.chat.completions.create(
+        completion = await asyncio.to_thread(
+            client.chat.completions.create,
             model="mistralai/mistral-large-3-675b-instruct-2512",
             messages=[{"role": "user", "content": prompt}],
             temperature=0.2,
@@ -1644,4 +1715,15 @@ async def live_scan(req: LiveScanRequest):
 # -------------------------------------------------------------------
 
 if __name__ == "__main__":
-    uvicorn.run("services.soilscan_ai.app:app", host="0.0.0.0", port=8002, reload=True)
+    if settings.DEBUG:
+        uvicorn.run("services.soilscan_ai.app:app", host="0.0.0.0", port=8002, reload=True)
+    else:
+        # uvloop + httptools from uvicorn[standard]; 2n+1 worker processes
+        uvicorn.run(
+            "services.soilscan_ai.app:app",
+            host="0.0.0.0",
+            port=8002,
+            loop="uvloop",
+            http="httptools",
+            workers=(os.cpu_count() or 1) * 2 + 1,
+        )
@@ -1,3 +1,3 @@
-from .settings import settings
-from .quantum_config import quantum_settings
+from .settings import settings, get_settings
+from .quantum_config import quantum_settings, get_quantum_settings
 from .database_config import get_db, engine
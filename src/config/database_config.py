@@ -1,27 +1,47 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import logging
+import random
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
 from src.config.settings import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
+logger = logging.getLogger(__name__)
+
+# Fraction of statements logged in DEBUG mode (replaces echo=True)
+SQL_LOG_SAMPLE_RATE = 0.01
+
+# Create async SQLAlchemy engine (asyncpg driver)
+engine = create_async_engine(
+    settings.ASYNC_DATABASE_URI,
     pool_pre_ping=True,
-    echo=settings.DEBUG
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    echo=False
 )
 
-# Create SessionLocal class
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+if settings.DEBUG:
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _log_sampled_sql(conn, cursor, statement, parameters, context, executemany):
+        """Log a random sample of SQL statements."""
+        if random.random() < SQL_LOG_SAMPLE_RATE:
+            logger.debug(statement)
+
+# Create AsyncSessionLocal factory
+AsyncSessionLocal = async_sessionmaker(
+    engine, class_=AsyncSession, expire_on_commit=False
+)
 
 # Base class for models
 Base = declarative_base()
 
-def get_db():
+async def get_db():
     """
-    Dependency generator for database sessions.
+    Async dependency generator for database sessions.
     Yields a database session and ensures it's closed after use.
     """
-    db = SessionLocal()
-    try:
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
@@ -25,4 +26,9 @@ class QuantumSettings(BaseSettings):
         extra="ignore"
     )
 
-quantum_settings = QuantumSettings()
+@lru_cache(maxsize=1)
+def get_quantum_settings() -> QuantumSettings:
+    """Build QuantumSettings once and reuse it."""
+    return QuantumSettings()
+
+quantum_settings = get_quantum_settings()
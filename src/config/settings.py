@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Union
 from pydantic import AnyHttpUrl, validator
@@ -36,6 +37,11 @@ class Settings(BaseSettings):
     POSTGRES_DB: str = "annadata"
     POSTGRES_PORT: str = "5432"
 
+    # Connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE: int = 1800  # seconds
+
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
@@ -63,4 +69,10 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build Settings once (reads .env and the environment) and reuse it."""
+    return Settings()
+
+
+settings = get_settings()
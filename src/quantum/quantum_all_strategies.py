@@ -18,6 +18,7 @@ Date: November 15, 2025
 Status: PRODUCTION-READY (CLEANED VERSION)
 """
 
+import os
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -26,13 +27,15 @@ from pathlib import Path
 import logging
 from typing import Dict, Tuple, List
 import joblib
+from joblib import Parallel, delayed
 import warnings
 import json
+from functools import lru_cache
 
 warnings.filterwarnings('ignore')
 
 from qiskit.circuit.library import ZZFeatureMap, RealAmplitudes
-from qiskit.primitives import Estimator
+from qiskit.primitives import StatevectorEstimator
 from qiskit_machine_learning.algorithms import VQR
 from qiskit_machine_learning.optimizers import COBYLA
 from sklearn.model_selection import train_test_split
@@ -44,22 +47,86 @@ from sklearn.decomposition import PCA
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Multi-threaded pyarrow CSV parser when available, pandas C parser otherwise
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+
+
+def read_csv_fp32(path, usecols=None):
+    """Read a CSV (optionally only `usecols`) and downcast float columns to float32"""
+    df = pd.read_csv(path, engine=CSV_ENGINE, usecols=usecols)
+    float_cols = df.select_dtypes('float').columns
+    return df.astype({c: np.float32 for c in float_cols})
+
+
+@lru_cache(maxsize=None)
+def build_vqr_circuits(num_qubits):
+    """Build (feature_map, ansatz) for a qubit count once; they depend on no data"""
+    feature_map = ZZFeatureMap(feature_dimension=num_qubits, reps=1, entanglement='linear')
+    ansatz = RealAmplitudes(num_qubits=num_qubits, reps=1, entanglement='full')
+    return feature_map, ansatz
+
 
 def clean_data(df):
-    """Clean dataframe: remove datetime, strings, and non-numeric columns"""
+    """Clean dataframe: keep numeric columns only and drop rows containing NaN.
+
+    Returns a single float32 numpy array (one copy of the data) together with
+    the names of the kept columns.
+    """
     logger.info(f"  Original shape: {df.shape}")
     
-    # Drop datetime columns
-    df = df.select_dtypes(exclude=['datetime64', 'object'])
+    # Keep numeric columns (drops datetime, string and object columns)
+    numeric_cols = df.columns[[pd.api.types.is_numeric_dtype(d) for d in df.dtypes]]
+    arr = df[numeric_cols].to_numpy(dtype=np.float32, na_value=np.nan)
     
-    logger.info(f"  After removing datetime/objects: {df.shape}")
+    logger.info(f"  After removing datetime/objects: {arr.shape}")
     
     # Drop any remaining NaN
-    df = df.dropna()
+    arr = arr[~np.isnan(arr).any(axis=1)]
+    
+    logger.info(f"  After removing NaN: {arr.shape}")
     
-    logger.info(f"  After removing NaN: {df.shape}")
+    return arr, numeric_cols
+
+
+def load_numeric_csv(path, target_col=-1):
+    """Load a CSV straight into float32 (X, y) numpy arrays.
+
+    With pyarrow, non-numeric columns are dropped from the Arrow schema so they
+    are never converted to Python objects, and each numeric column is copied
+    once into a preallocated float32 matrix. Rows containing NaN are dropped.
+    """
+    if CSV_ENGINE == 'pyarrow':
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+        import pyarrow.types as pa_types
+        
+        table = pa_csv.read_csv(path)
+        logger.info(f"  Original shape: {table.shape}")
+        # Same columns as the pandas path: is_numeric_dtype includes booleans
+        numeric = [
+            field.name for field in table.schema
+            if pa_types.is_integer(field.type)
+            or pa_types.is_floating(field.type)
+            or pa_types.is_boolean(field.type)
+        ]
+        arr = np.empty((table.num_rows, len(numeric)), dtype=np.float32)
+        for i, name in enumerate(numeric):
+            # Cast first so nulls (including in bool columns) become NaN.
+            # ChunkedArray.to_numpy() always copies; its zero_copy_only
+            # keyword only exists in newer pyarrow releases.
+            arr[:, i] = table.column(name).cast(pa.float32()).to_numpy()
+        arr = arr[~np.isnan(arr).any(axis=1)]
+        logger.info(f"  Numeric rows without NaN: {arr.shape}")
+    else:
+        arr, _ = clean_data(read_csv_fp32(path))
     
-    return df
+    y = arr[:, target_col]
+    X = np.delete(arr, target_col, axis=1)
+    return X, y
 
 
 # ============================================================================
@@ -99,12 +166,12 @@ class QuantumWeatherPredictor:
         logger.info(f"PCA variance explained: {self.pca.explained_variance_ratio_.sum():.1%}")
         
         # Build quantum circuit
-        feature_map = ZZFeatureMap(feature_dimension=n_components, reps=1, entanglement='linear')
-        ansatz = RealAmplitudes(num_qubits=n_components, reps=1, entanglement='full')
+        feature_map, ansatz = build_vqr_circuits(n_components)
         
         # Train
         logger.info(f"Training quantum circuit ({n_components} qubits, {self.max_iterations} iter)...")
-        estimator = Estimator()
+        # V2 estimator: each QNN forward pass is submitted as one batched job of pubs
+        estimator = StatevectorEstimator()
         optimizer = COBYLA(maxiter=self.max_iterations)
         
         self.vqr = VQR(
@@ -203,6 +270,15 @@ class QuantumFeatureSelector:
 # STRATEGY 7: LEARNING CURVES ANALYSIS
 # ============================================================================
 
+def _fit_learning_curve_rf(X_train, y_train, X_test, y_test, n_jobs=1):
+    """Fit one learning-curve RF with `n_jobs` threads"""
+    rf = RandomForestRegressor(n_estimators=50, max_depth=10, random_state=42, n_jobs=n_jobs)
+    rf.fit(X_train, y_train)
+    train_mse = float(mean_squared_error(y_train, rf.predict(X_train)))
+    test_mse = float(mean_squared_error(y_test, rf.predict(X_test)))
+    return train_mse, test_mse
+
+
 class LearningCurveAnalyzer:
     """Generate learning curves for quantum vs classical"""
     
@@ -231,38 +307,60 @@ class LearningCurveAnalyzer:
         
         logger.info(f"Analyzing learning curves with {len(train_sizes)} training sizes...")
         
-        for size in train_sizes:
-            logger.info(f"\n  Training size: {size}")
+        # Ascending so each step's training set extends the previous one
+        fit_sizes = sorted(size for size in train_sizes if size <= len(X_train_full))
+        
+        # Classical RF: sizes are independent, so split the cores between them.
+        # With one core this runs in-process and never starts loky workers.
+        n_cpus = os.cpu_count() or 1
+        n_workers = max(1, min(len(fit_sizes), n_cpus))
+        rf_jobs = max(1, n_cpus // max(len(fit_sizes), 1))
+        rf_results = Parallel(n_jobs=n_workers, backend='loky')(
+            delayed(_fit_learning_curve_rf)(
+                X_train_full[:size], y_train_full[:size], X_test, y_test, n_jobs=rf_jobs
+            )
+            for size in fit_sizes
+        )
+        
+        # Once a quantum fit fails, later sizes would fail the same way: skip them
+        quantum_failed = X_train_full.shape[1] < 1
+        if quantum_failed:
+            logger.warning("  Quantum skipped: no feature columns")
+        else:
+            n_qubits = min(4, X_train_full.shape[1])
             
-            if size > len(X_train_full):
-                continue
+            # Circuits and estimator depend only on the qubit count: build once
+            feature_map, ansatz = build_vqr_circuits(n_qubits)
+            estimator = StatevectorEstimator()
+        
+        for size, (rf_train, rf_test) in zip(fit_sizes, rf_results):
+            logger.info(f"\n  Training size: {size}")
             
             X_train_subset = X_train_full[:size]
             y_train_subset = y_train_full[:size]
             
-            # Classical RF
-            rf = RandomForestRegressor(n_estimators=50, max_depth=10, random_state=42, n_jobs=-1)
-            rf.fit(X_train_subset, y_train_subset)
-            
-            rf_mse_train.append(float(mean_squared_error(y_train_subset, rf.predict(X_train_subset))))
-            rf_mse_test.append(float(mean_squared_error(y_test, rf.predict(X_test))))
+            rf_mse_train.append(rf_train)
+            rf_mse_test.append(rf_test)
             
             logger.info(f"    RF:      Train MSE {rf_mse_train[-1]:.2f}, Test MSE {rf_mse_test[-1]:.2f}")
             
             # Quantum (simplified for learning curves)
+            if quantum_failed:
+                quantum_mse_train.append(None)
+                quantum_mse_test.append(None)
+                continue
+            
             try:
+                # Scaler and PCA are fitted on the whole prefix so every row
+                # the PCA sees shares one set of scaling statistics
                 scaler = StandardScaler()
                 X_scaled = scaler.fit_transform(X_train_subset)
-                pca = PCA(n_components=min(4, X_scaled.shape[1]))
+                pca = PCA(n_components=n_qubits)
                 X_pca = pca.fit_transform(X_scaled)
                 
                 scaler_y = StandardScaler()
                 y_scaled = scaler_y.fit_transform(y_train_subset.reshape(-1, 1)).flatten()
                 
-                feature_map = ZZFeatureMap(feature_dimension=X_pca.shape[1], reps=1, entanglement='linear')
-                ansatz = RealAmplitudes(num_qubits=X_pca.shape[1], reps=1, entanglement='full')
-                
-                estimator = Estimator()
                 optimizer = COBYLA(maxiter=30)
                 
                 vqr = VQR(feature_map=feature_map, ansatz=ansatz, optimizer=optimizer, estimator=estimator)
@@ -280,11 +378,15 @@ class LearningCurveAnalyzer:
                 
                 logger.info(f"    Quantum: Train MSE {quantum_mse_train[-1]:.2f}, Test MSE {quantum_mse_test[-1]:.2f}")
             except Exception as e:
-                logger.warning(f"    Quantum error: skipping - {str(e)[:50]}")
+                # Qiskit raises its own error types; only RF failures propagate
+                logger.warning(
+                    f"    Quantum error: skipping remaining sizes - {str(e)[:50]}", exc_info=True
+                )
+                quantum_failed = True
                 quantum_mse_train.append(None)
                 quantum_mse_test.append(None)
         
-        return train_sizes, quantum_mse_train, quantum_mse_test, rf_mse_train, rf_mse_test
+        return fit_sizes, quantum_mse_train, quantum_mse_test, rf_mse_train, rf_mse_test
 
 
 # ============================================================================
@@ -303,15 +405,10 @@ def main():
         try:
             # Load weather CSV
             logger.info("  Reading all_regions_synthetic_weather_historical.csv...")
-            weather_df = pd.read_csv('data/processed/all_regions_synthetic_weather_historical.csv')
-            logger.info(f"  ✓ Raw shape: {weather_df.shape}")
-            
-            # Clean data (remove datetime, strings, NaN)
-            weather_df = clean_data(weather_df)
-            
-            # Extract features and target
-            y_weather = weather_df.iloc[:, -1].values  # Last column as target
-            X_weather = weather_df.iloc[:, :-1].values  # All other columns as features
+            # Numeric columns only, NaN rows dropped; last column is the target
+            X_weather, y_weather = load_numeric_csv(
+                'data/processed/all_regions_synthetic_weather_historical.csv'
+            )
             
             logger.info(f"✓ Weather data: X {X_weather.shape}, y {y_weather.shape}")
         except Exception as e:
@@ -354,19 +451,23 @@ def main():
         
         try:
             logger.info("  Reading crop_processed.csv...")
-            X_crop_df = pd.read_csv('data/processed/crop_processed.csv')
+            X_crop_df = read_csv_fp32('data/processed/crop_processed.csv')
             logger.info("  Reading crop_raw_data.csv...")
-            y_crop_df = pd.read_csv('data/processed/crop_raw_data.csv')
+            # Only the target column is needed: 'Yield', else the last column
+            raw_path = 'data/processed/crop_raw_data.csv'
+            raw_cols = pd.read_csv(raw_path, nrows=0).columns
+            y_col = 'Yield' if 'Yield' in raw_cols else raw_cols[-1]
+            y_crop_df = read_csv_fp32(raw_path, usecols=[y_col])
             
             # Clean X
-            X_crop_df = clean_data(X_crop_df)
+            X_crop_arr, _ = clean_data(X_crop_df)
             
             # Get y
-            y_crop = y_crop_df['Yield'].values if 'Yield' in y_crop_df.columns else y_crop_df.iloc[:, -1].values
+            y_crop = y_crop_df[y_col].values
             
             # Ensure same length
-            min_len = min(len(X_crop_df), len(y_crop))
-            X_crop = X_crop_df.iloc[:min_len].values
+            min_len = min(len(X_crop_arr), len(y_crop))
+            X_crop = X_crop_arr[:min_len]
             y_crop = y_crop[:min_len]
             
             logger.info(f"✓ Crop data: X {X_crop.shape}, y {y_crop.shape}")
@@ -3,8 +3,10 @@ Root test configuration for Annadata OS.
 Sets up fixtures shared across all test modules.
 """
 
+import hashlib
 import os
 import sys
+from contextvars import ContextVar
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -32,3 +34,154 @@ os.environ.update(
         "REDIS_PORT": "6379",
     }
 )
+
+
+# ---------------------------------------------------------------------------
+# Shared in-memory database
+# ---------------------------------------------------------------------------
+
+# The current test's session.  Apps are built once per run, so their get_db
+# override reads the session from here rather than closing over it.
+_current_db_session: ContextVar = ContextVar("current_db_session")
+
+
+async def _override_get_db():
+    """
+    Yield the current test's in-memory SQLite session.
+
+    Commits and rolls back like the production ``get_db``; under
+    ``db_session`` those only act on a SAVEPOINT.
+    """
+    session = _current_db_session.get()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+
+
+@pytest.fixture(scope="session")
+async def db_engine():
+    """
+    In-memory SQLite engine with the full schema, created once per session.
+
+    The named shared-cache URI lets every pooled connection open the same
+    in-memory database, which lives as long as one connection stays open
+    in the pool.
+
+    pysqlite never emits BEGIN itself, so SAVEPOINTs would not nest inside
+    the outer transaction.  The listeners below take over transaction
+    control (SQLAlchemy's pysqlite SAVEPOINT recipe).
+    """
+    from sqlalchemy import event
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+    from services.shared.db.session import Base
+
+    # Import models BEFORE create_all so they are registered on Base.metadata.
+    import services.shared.db.models  # noqa: F401
+
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///file:annadata_test_db?mode=memory&cache=shared&uri=true",
+        echo=False,
+        connect_args={"check_same_thread": False},
+        poolclass=AsyncAdaptedQueuePool,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_driver_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
+@pytest.fixture()
+async def db_session(db_engine):
+    """
+    Session bound to an outer transaction that is rolled back after the test.
+
+    Commits issued by the code under test only release a SAVEPOINT, so no
+    rows outlive the test and the schema never needs to be rebuilt.
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        session = AsyncSession(
+            bind=conn,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+        )
+        token = _current_db_session.set(session)
+        try:
+            yield session
+        finally:
+            _current_db_session.reset(token)
+            await session.close()
+            await trans.rollback()
+
+
+@pytest.fixture(scope="session")
+def override_get_db():
+    """``get_db`` override that yields the active ``db_session``."""
+    return _override_get_db
+
+
+# ---------------------------------------------------------------------------
+# Fast password hashing
+# ---------------------------------------------------------------------------
+
+
+def _sha256_hash(password: str) -> str:
+    return hashlib.sha256(password.encode()).hexdigest()
+
+
+def _sha256_verify(plain_password: str, hashed_password: str) -> bool:
+    return _sha256_hash(plain_password) == hashed_password
+
+
+@pytest.fixture(autouse=True)
+def fast_password_hashing(monkeypatch):
+    """
+    Swap bcrypt for SHA-256 in the auth router during tests.
+
+    Only the names bound in ``services.shared.auth.router`` are patched, so
+    the bcrypt helpers in ``services.shared.auth.jwt`` are still tested
+    for real by the unit tests.
+    """
+    monkeypatch.setattr(
+        "services.shared.auth.router.get_password_hash", _sha256_hash
+    )
+    monkeypatch.setattr(
+        "services.shared.auth.router.verify_password", _sha256_verify
+    )
+
+
+# ---------------------------------------------------------------------------
+# Rate limiting
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture(scope="session", autouse=True)
+def disable_rate_limiting():
+    """
+    Turn the shared slowapi limiter off for the whole run.
+
+    With ``enabled`` False, SlowAPIMiddleware and the per-route checks skip
+    key extraction and storage hits, and the /batch-analyze sample budget
+    is not charged.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr("services.shared.auth.router.limiter.enabled", False)
+        yield
@@ -0,0 +1,41 @@
+"""
+Integration tests for the shared ``db_session`` fixture.
+
+Each test runs inside an outer transaction that is rolled back afterwards,
+so rows committed by one test must not be visible to the next.
+"""
+
+import pytest
+
+try:
+    import aiosqlite  # noqa: F401
+
+    HAS_AIOSQLITE = True
+except ImportError:
+    HAS_AIOSQLITE = False
+
+pytestmark = pytest.mark.skipif(not HAS_AIOSQLITE, reason="aiosqlite not installed")
+
+from sqlalchemy import func, select  # noqa: E402
+
+from services.shared.db.models import ServiceLog  # noqa: E402
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("run", [1, 2])
+async def test_committed_rows_are_rolled_back(db_session, run):
+    """A commit inside the test only releases a SAVEPOINT."""
+    count = select(func.count()).select_from(ServiceLog)
+    assert await db_session.scalar(count) == 0
+
+    db_session.add(
+        ServiceLog(
+            service_name="soilscan_ai",
+            endpoint="/analyze",
+            request_method="POST",
+            status_code=201,
+        )
+    )
+    await db_session.commit()
+
+    assert await db_session.scalar(count) == 1
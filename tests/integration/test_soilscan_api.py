@@ -3,38 +3,15 @@ Integration tests for the SoilScan AI service.
 
 These tests use httpx.ASGITransport to test the FastAPI app directly
 without needing a running server or database. The DB dependency is
-overridden with an in-memory SQLite session so that endpoints exercise
-real DB logic without requiring PostgreSQL.
+overridden with the shared in-memory SQLite session from ``conftest.py``
+so that endpoints exercise real DB logic without requiring PostgreSQL.
 """
 
 import httpx
+import orjson
 import pytest
-from sqlalchemy import event
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from services.shared.db.session import Base, get_db
-
-
-# ---------------------------------------------------------------------------
-# In-memory SQLite engine for tests
-# ---------------------------------------------------------------------------
-_test_engine = create_async_engine("sqlite+aiosqlite://", echo=False)
-_test_session_factory = async_sessionmaker(
-    _test_engine, class_=AsyncSession, expire_on_commit=False
-)
-
-
-async def _override_get_db():
-    """Yield an in-memory SQLite session instead of PostgreSQL."""
-    async with _test_session_factory() as session:
-        try:
-            yield session
-            await session.commit()
-        except Exception:
-            await session.rollback()
-            raise
-        finally:
-            await session.close()
+from services.shared.db.session import get_db
 
 
 # ---------------------------------------------------------------------------
@@ -53,28 +30,29 @@ SAMPLE_SOIL_REQUEST = {
     "soil_type": "alluvial",
 }
 
+# Pre-encoded once so single-sample posts skip per-request JSON encoding.
+_SAMPLE_BYTES = orjson.dumps(SAMPLE_SOIL_REQUEST)
+_JSON_HEADERS = {"content-type": "application/json"}
 
-@pytest.fixture()
-async def soilscan_app():
+
+pytestmark = pytest.mark.usefixtures("db_session")
+
+
+@pytest.fixture(scope="session")
+async def soilscan_app(override_get_db):
     """Return the real SoilScan app with the DB dependency overridden."""
     from services.soilscan_ai.app import app
 
-    # Create tables in the in-memory SQLite database
-    async with _test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-
-    app.dependency_overrides[get_db] = _override_get_db
+    saved_overrides = dict(app.dependency_overrides)
+    app.dependency_overrides[get_db] = override_get_db
     yield app
     app.dependency_overrides.clear()
+    app.dependency_overrides.update(saved_overrides)
 
-    # Tear down: drop all tables
-    async with _test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
 
-
-@pytest.fixture()
+@pytest.fixture(scope="module")
 async def client(soilscan_app):
-    """Async httpx client for the test app."""
+    """Async httpx client shared by every test in the module."""
     transport = httpx.ASGITransport(app=soilscan_app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
@@ -96,6 +74,17 @@ async def test_health_check(client):
     assert "timestamp" in data
 
 
+@pytest.mark.asyncio
+async def test_health_check_rebuilds_stale_body(client, monkeypatch):
+    """Without the lifespan refresh task, /health rebuilds a stale body."""
+    import services.soilscan_ai.app as soilscan
+
+    monkeypatch.setattr(soilscan, "_health_bytes", orjson.dumps({"timestamp": "stale"}))
+    monkeypatch.setattr(soilscan, "_health_built_at", 0.0)
+    response = await client.get("/health")
+    assert response.json()["timestamp"] != "stale"
+
+
 @pytest.mark.asyncio
 async def test_root_endpoint(client):
     """Root endpoint returns service info and features list."""
@@ -106,12 +95,38 @@ async def test_root_endpoint(client):
     assert data["version"] == "1.0.0"
     assert isinstance(data["features"], list)
     assert len(data["features"]) > 0
+    assert response.headers["cache-control"] == "public, max-age=3600"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "if_none_match",
+    ["{etag}", 'W/{etag}', '"stale", {etag}', '"stale",W/{etag}', "*"],
+)
+async def test_root_endpoint_etag_returns_304(client, if_none_match):
+    """A matching If-None-Match on the root endpoint returns 304 with no body."""
+    etag = (await client.get("/")).headers["etag"]
+    response = await client.get(
+        "/", headers={"If-None-Match": if_none_match.format(etag=etag)}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+@pytest.mark.asyncio
+async def test_root_endpoint_stale_etag_returns_200(client):
+    """A non-matching If-None-Match gets the full body."""
+    response = await client.get("/", headers={"If-None-Match": '"stale", W/"old"'})
+    assert response.status_code == 200
+    assert response.json()["service"] == "SoilScan AI"
 
 
 @pytest.mark.asyncio
 async def test_analyze_soil(client):
     """POST /analyze accepts a SoilSampleRequest and returns analysis."""
-    response = await client.post("/analyze", json=SAMPLE_SOIL_REQUEST)
+    response = await client.post(
+        "/analyze", content=_SAMPLE_BYTES, headers=_JSON_HEADERS
+    )
     assert response.status_code == 201
     data = response.json()
     assert "analysis_id" in data
@@ -132,11 +147,72 @@ async def test_analyze_soil_missing_body_returns_422(client):
     assert response.status_code == 422
 
 
+@pytest.mark.asyncio
+async def test_batch_analyze(client):
+    """POST /batch-analyze scores every sample and reports the count."""
+    second = {**SAMPLE_SOIL_REQUEST, "plot_id": "test-plot-002"}
+    response = await client.post(
+        "/batch-analyze", json={"samples": [SAMPLE_SOIL_REQUEST, second]}
+    )
+    assert response.status_code == 201
+    data = response.json()
+    assert data["count"] == 2
+    assert [r["plot_id"] for r in data["results"]] == ["test-plot-001", "test-plot-002"]
+    assert len({r["analysis_id"] for r in data["results"]}) == 2
+
+
+@pytest.mark.asyncio
+async def test_batch_analyze_too_many_samples_returns_422(client):
+    """POST /batch-analyze rejects batches above the per-request cap."""
+    response = await client.post(
+        "/batch-analyze", json={"samples": [SAMPLE_SOIL_REQUEST] * 1001}
+    )
+    assert response.status_code == 422
+
+
+@pytest.fixture()
+def rate_limited():
+    """Enable the shared limiter with empty storage for one test."""
+    from services.shared.auth.router import limiter
+
+    limiter.reset()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(limiter, "enabled", True)
+        yield limiter
+    limiter.reset()
+
+
+@pytest.mark.asyncio
+async def test_batch_analyze_sample_budget_returns_429(
+    client, rate_limited, monkeypatch
+):
+    """Samples are charged against the per-IP budget; overspending gets 429."""
+    from limits import parse as parse_rate_limit
+
+    monkeypatch.setattr(
+        "services.soilscan_ai.app._BATCH_SAMPLE_RATE", parse_rate_limit("10/minute")
+    )
+    body = orjson.dumps({"samples": [SAMPLE_SOIL_REQUEST] * 5})
+    for _ in range(2):
+        response = await client.post(
+            "/batch-analyze", content=body, headers=_JSON_HEADERS
+        )
+        assert response.status_code == 201
+
+    body = orjson.dumps({"samples": [SAMPLE_SOIL_REQUEST]})
+    response = await client.post("/batch-analyze", content=body, headers=_JSON_HEADERS)
+    assert response.status_code == 429
+    assert "sample budget" in response.json()["detail"]
+    assert 1 <= int(response.headers["retry-after"]) <= 60
+
+
 @pytest.mark.asyncio
 async def test_get_report(client):
     """GET /report/{id} returns the analysis for an ID that exists."""
     # First, create an analysis so the in-memory store has data
-    create_resp = await client.post("/analyze", json=SAMPLE_SOIL_REQUEST)
+    create_resp = await client.post(
+        "/analyze", content=_SAMPLE_BYTES, headers=_JSON_HEADERS
+    )
     assert create_resp.status_code == 201
     analysis_id = create_resp.json()["analysis_id"]
 
@@ -161,8 +237,12 @@ async def test_get_report_not_found(client):
 async def test_get_analysis_history(client):
     """GET /history returns historical analyses for a plot."""
     # Create two analyses for the same plot to populate the store
-    await client.post("/analyze", json=SAMPLE_SOIL_REQUEST)
-    await client.post("/analyze", json=SAMPLE_SOIL_REQUEST)
+    await client.post(
+        "/analyze", content=_SAMPLE_BYTES, headers=_JSON_HEADERS
+    )
+    await client.post(
+        "/analyze", content=_SAMPLE_BYTES, headers=_JSON_HEADERS
+    )
 
     response = await client.get("/history", params={"plot_id": "test-plot-001"})
     assert response.status_code == 200
@@ -178,6 +258,14 @@ async def test_get_analysis_history(client):
         assert "health_score" in entry
 
 
+@pytest.mark.asyncio
+async def test_get_analysis_history_is_privately_cacheable(client):
+    """History is per-caller, so shared caches must not store it."""
+    response = await client.get("/history", params={"plot_id": "test-plot-001"})
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, max-age=60"
+
+
 @pytest.mark.asyncio
 async def test_get_analysis_history_missing_plot_id_returns_422(client):
     """GET /history without plot_id query param returns 422."""
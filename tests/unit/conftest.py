@@ -0,0 +1,34 @@
+"""
+Unit test configuration.
+Fixtures shared by the tests under tests/unit.
+"""
+
+import pytest
+from passlib.context import CryptContext
+
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_bcrypt():
+    """
+    Hash with bcrypt cost 4 instead of the production default of 12.
+
+    Still produces real ``$2b$`` hashes, so the format, salting and verify
+    checks stay meaningful, at roughly 1/256 of the CPU cost.
+    """
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(
+            "services.shared.auth.jwt.pwd_context",
+            CryptContext(schemes=["bcrypt"], bcrypt__rounds=4),
+        )
+        yield
+
+
+KNOWN_PASSWORD = "test_password_123"
+
+
+@pytest.fixture(scope="session")
+def known_bcrypt_hash(fast_bcrypt):
+    """A bcrypt hash of ``KNOWN_PASSWORD``, computed once per run."""
+    from services.shared.auth.jwt import get_password_hash
+
+    return get_password_hash(KNOWN_PASSWORD)
@@ -7,57 +7,54 @@ import os
 import pytest
 
 
+@pytest.fixture(scope="module")
+def settings_obj():
+    """The shared settings singleton, imported once for the module."""
+    from services.shared.config import settings
+
+    return settings
+
+
 class TestSharedSettings:
     """Tests for the SharedSettings configuration class."""
 
-    def test_settings_loads_defaults(self):
-        from services.shared.config import settings
+    def test_settings_loads_defaults(self, settings_obj):
+        assert settings_obj.APP_NAME == "Annadata"
+        assert settings_obj.JWT_ALGORITHM == "HS256"
+        assert settings_obj.REDIS_PORT == 6379
+        assert settings_obj.ACCESS_TOKEN_EXPIRE_MINUTES == 30  # overridden in conftest
 
-        assert settings.APP_NAME == "Annadata"
-        assert settings.JWT_ALGORITHM == "HS256"
-        assert settings.REDIS_PORT == 6379
-        assert settings.ACCESS_TOKEN_EXPIRE_MINUTES == 30  # overridden in conftest
+    def test_db_pool_defaults(self, settings_obj):
+        assert settings_obj.DB_POOL_SIZE == 20
+        assert settings_obj.DB_MAX_OVERFLOW == 10
+        assert settings_obj.DB_POOL_RECYCLE == 1800
 
-    def test_database_url_property(self):
-        from services.shared.config import settings
-
-        url = settings.DATABASE_URL
+    def test_database_url_property(self, settings_obj):
+        url = settings_obj.DATABASE_URL
         assert url.startswith("postgresql+asyncpg://")
-        assert settings.POSTGRES_USER in url
-        assert settings.POSTGRES_DB in url
-
-    def test_sync_database_url_property(self):
-        from services.shared.config import settings
+        assert settings_obj.POSTGRES_USER in url
+        assert settings_obj.POSTGRES_DB in url
 
-        url = settings.SYNC_DATABASE_URL
+    def test_sync_database_url_property(self, settings_obj):
+        url = settings_obj.SYNC_DATABASE_URL
         assert url.startswith("postgresql://")
         assert "asyncpg" not in url
 
-    def test_redis_url_property(self):
-        from services.shared.config import settings
-
-        url = settings.REDIS_URL
+    def test_redis_url_property(self, settings_obj):
+        url = settings_obj.REDIS_URL
         assert url.startswith("redis://")
-        assert str(settings.REDIS_PORT) in url
-
-    def test_celery_broker_url_equals_redis_url(self):
-        from services.shared.config import settings
-
-        assert settings.CELERY_BROKER_URL == settings.REDIS_URL
+        assert str(settings_obj.REDIS_PORT) in url
 
-    def test_celery_result_backend_equals_redis_url(self):
-        from services.shared.config import settings
+    def test_celery_broker_url_equals_redis_url(self, settings_obj):
+        assert settings_obj.CELERY_BROKER_URL == settings_obj.REDIS_URL
 
-        assert settings.CELERY_RESULT_BACKEND == settings.REDIS_URL
+    def test_celery_result_backend_equals_redis_url(self, settings_obj):
+        assert settings_obj.CELERY_RESULT_BACKEND == settings_obj.REDIS_URL
 
-    def test_env_override(self):
+    def test_env_override(self, settings_obj):
         """Verify conftest.py environment overrides are loaded."""
-        from services.shared.config import settings
-
-        assert settings.APP_ENV == "test"
-        assert settings.JWT_SECRET_KEY == "test-secret-key-do-not-use-in-production"
-
-    def test_cors_origins_is_list(self):
-        from services.shared.config import settings
+        assert settings_obj.APP_ENV == "test"
+        assert settings_obj.JWT_SECRET_KEY == "test-secret-key-do-not-use-in-production"
 
-        assert isinstance(settings.BACKEND_CORS_ORIGINS, list)
+    def test_cors_origins_is_list(self, settings_obj):
+        assert isinstance(settings_obj.BACKEND_CORS_ORIGINS, list)
@@ -3,73 +3,90 @@ Unit tests for services.shared.auth.jwt — JWT token and password utilities.
 """
 
 import uuid
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 
 import pytest
+from jose import jwt
+from pydantic import ValidationError
+
+from services.shared.auth.jwt import (
+    TokenData,
+    TokenPayload,
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    verify_password,
+)
+from services.shared.config import settings
+
+# Farmer token for the nil UUID that expired at 2020-01-01T00:00:00Z, signed
+# with the JWT_SECRET_KEY / HS256 pinned in tests/conftest.py.
+EXPIRED_TOKEN = (
+    "eyJhbGciOiJIUzI1NiIsInR5cCI6IkpXVCJ9."
+    "eyJzdWIiOiIwMDAwMDAwMC0wMDAwLTAwMDAtMDAwMC0wMDAwMDAwMDAwMDAiLCJyb2xlIjoiZmFybWVyIiwiZXhwIjoxNTc3ODM2ODAwfQ."
+    "2w30MWdP8ouaUiL3_ytHHo5yH8f04xjr9nvzmqDkxkI"
+)
+
+
+@pytest.fixture(scope="module")
+def sample_token_pair():
+    """A user id and a valid farmer token for it, signed once per module."""
+    user_id = uuid.uuid4()
+    return user_id, create_access_token(user_id=user_id, role="farmer")
 
 
 class TestPasswordHashing:
     """Tests for bcrypt password hashing and verification."""
 
-    def test_hash_password_returns_bcrypt_hash(self):
-        from services.shared.auth.jwt import get_password_hash
-
-        hashed = get_password_hash("my_secure_password")
-        assert hashed is not None
-        assert hashed != "my_secure_password"
+    @pytest.mark.parametrize(
+        "password, wrong",
+        [
+            ("my_secure_password", None),
+            ("correct_password", "wrong_password"),
+            ("", "not_empty"),
+            # bcrypt's 72-byte input limit
+            ("a" * 72, "a" * 71),
+        ],
+        ids=["plain", "wrong_rejected", "empty", "max_length"],
+    )
+    def test_hash_and_verify(self, password, wrong):
+        hashed = get_password_hash(password)
+        assert hashed != password
         # bcrypt hashes start with $2b$
         assert hashed.startswith("$2b$")
-
-    def test_verify_correct_password(self):
-        from services.shared.auth.jwt import get_password_hash, verify_password
-
-        password = "test_password_123"
-        hashed = get_password_hash(password)
         assert verify_password(password, hashed) is True
+        if wrong is not None:
+            assert verify_password(wrong, hashed) is False
 
-    def test_verify_wrong_password(self):
-        from services.shared.auth.jwt import get_password_hash, verify_password
-
-        hashed = get_password_hash("correct_password")
-        assert verify_password("wrong_password", hashed) is False
-
-    def test_different_passwords_produce_different_hashes(self):
-        from services.shared.auth.jwt import get_password_hash
-
-        hash1 = get_password_hash("password_one")
-        hash2 = get_password_hash("password_two")
-        assert hash1 != hash2
+    def test_verify_correct_password(self, known_bcrypt_hash):
+        assert verify_password("test_password_123", known_bcrypt_hash) is True
 
-    def test_same_password_produces_different_hashes(self):
-        """bcrypt uses random salts, so same input -> different hashes."""
-        from services.shared.auth.jwt import get_password_hash
+    def test_verify_wrong_password(self, known_bcrypt_hash):
+        assert verify_password("wrong_password", known_bcrypt_hash) is False
 
-        hash1 = get_password_hash("same_password")
-        hash2 = get_password_hash("same_password")
-        assert hash1 != hash2
-
-    def test_empty_password(self):
-        from services.shared.auth.jwt import get_password_hash, verify_password
-
-        hashed = get_password_hash("")
-        assert verify_password("", hashed) is True
-        assert verify_password("not_empty", hashed) is False
+    @pytest.mark.parametrize(
+        "first, second",
+        [
+            ("password_one", "password_two"),
+            # bcrypt uses random salts, so same input -> different hashes
+            ("same_password", "same_password"),
+        ],
+        ids=["different_passwords", "same_password"],
+    )
+    def test_hashes_differ(self, first, second):
+        assert get_password_hash(first) != get_password_hash(second)
 
 
 class TestTokenCreation:
     """Tests for JWT access token creation."""
 
     def test_create_access_token_returns_string(self):
-        from services.shared.auth.jwt import create_access_token
-
         user_id = uuid.uuid4()
         token = create_access_token(user_id=user_id, role="farmer")
         assert isinstance(token, str)
         assert len(token) > 0
 
     def test_create_access_token_with_custom_expiry(self):
-        from services.shared.auth.jwt import create_access_token
-
         user_id = uuid.uuid4()
         token = create_access_token(
             user_id=user_id,
@@ -79,8 +96,6 @@ class TestTokenCreation:
         assert isinstance(token, str)
 
     def test_create_access_token_encodes_user_id_and_role(self):
-        from services.shared.auth.jwt import create_access_token, decode_access_token
-
         user_id = uuid.uuid4()
         token = create_access_token(user_id=user_id, role="researcher")
 
@@ -93,11 +108,8 @@ class TestTokenCreation:
 class TestTokenDecoding:
     """Tests for JWT access token decoding and validation."""
 
-    def test_decode_valid_token(self):
-        from services.shared.auth.jwt import create_access_token, decode_access_token
-
-        user_id = uuid.uuid4()
-        token = create_access_token(user_id=user_id, role="farmer")
+    def test_decode_valid_token(self, sample_token_pair):
+        user_id, token = sample_token_pair
         payload = decode_access_token(token)
 
         assert payload is not None
@@ -106,37 +118,28 @@ class TestTokenDecoding:
         assert payload.exp is not None
 
     def test_decode_invalid_token_returns_none(self):
-        from services.shared.auth.jwt import decode_access_token
-
         result = decode_access_token("this-is-not-a-valid-jwt-token")
         assert result is None
 
-    def test_decode_tampered_token_returns_none(self):
-        from services.shared.auth.jwt import create_access_token, decode_access_token
-
-        user_id = uuid.uuid4()
-        token = create_access_token(user_id=user_id, role="farmer")
+    def test_decode_tampered_token_returns_none(self, sample_token_pair):
+        _, token = sample_token_pair
         # Tamper with the token
         tampered = token[:-5] + "XXXXX"
         result = decode_access_token(tampered)
         assert result is None
 
     def test_decode_expired_token_returns_none(self):
-        from services.shared.auth.jwt import create_access_token, decode_access_token
-
-        user_id = uuid.uuid4()
-        # Create a token that expires immediately (negative delta)
-        token = create_access_token(
-            user_id=user_id,
-            role="farmer",
-            expires_delta=timedelta(seconds=-10),
+        # The signature is valid, so None can only come from the expiry check
+        claims = jwt.decode(
+            EXPIRED_TOKEN,
+            settings.JWT_SECRET_KEY,
+            algorithms=[settings.JWT_ALGORITHM],
+            options={"verify_exp": False},
         )
-        result = decode_access_token(token)
-        assert result is None
+        assert claims["role"] == "farmer"
+        assert decode_access_token(EXPIRED_TOKEN) is None
 
     def test_decode_empty_string_returns_none(self):
-        from services.shared.auth.jwt import decode_access_token
-
         result = decode_access_token("")
         assert result is None
 
@@ -145,19 +148,25 @@ class TestTokenSchemas:
     """Tests for TokenPayload and TokenData Pydantic models."""
 
     def test_token_data_default_type(self):
-        from services.shared.auth.jwt import TokenData
+        td = TokenData.model_construct(access_token="some-token")
+        assert td.token_type == "bearer"
+        assert td.access_token == "some-token"
 
+    def test_token_data_validates(self):
         td = TokenData(access_token="some-token")
         assert td.token_type == "bearer"
-        assert td.access_token == "some-token"
+        with pytest.raises(ValidationError):
+            TokenData()
 
     def test_token_payload_fields(self):
-        from datetime import datetime, timezone
-
-        from services.shared.auth.jwt import TokenPayload
-
         now = datetime.now(timezone.utc)
         tp = TokenPayload(sub="some-uuid", exp=now, role="admin")
         assert tp.sub == "some-uuid"
         assert tp.role == "admin"
         assert tp.exp == now
+
+    def test_token_payload_validates(self):
+        tp = TokenPayload(sub="some-uuid", exp="2030-01-01T00:00:00Z", role="admin")
+        assert tp.exp == datetime(2030, 1, 1, tzinfo=timezone.utc)
+        with pytest.raises(ValidationError):
+            TokenPayload(exp="2030-01-01T00:00:00Z", role="admin")
@@ -0,0 +1,72 @@
+"""
+Unit tests for src.quantum.quantum_all_strategies — learning-curve helpers.
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("qiskit_machine_learning")
+
+from src.quantum import quantum_all_strategies as qas  # noqa: E402
+
+
+@pytest.fixture()
+def regression_data():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200, 6)).astype(np.float32)
+    y = (X @ rng.normal(size=6)).astype(np.float32)
+    return X, y
+
+
+class TestLearningCurves:
+    """Tests for LearningCurveAnalyzer.generate_learning_curves."""
+
+    def test_quantum_failure_keeps_rf_results(self, monkeypatch, regression_data):
+        calls = []
+
+        def failing_fit(self, X, y):
+            calls.append(len(X))
+            raise RuntimeError("simulated qiskit failure")
+
+        monkeypatch.setattr(qas.VQR, "fit", failing_fit)
+        X, y = regression_data
+
+        sizes, q_train, q_test, rf_train, rf_test = (
+            qas.LearningCurveAnalyzer.generate_learning_curves(
+                X, y, train_sizes=[50, 100, 150]
+            )
+        )
+
+        assert sizes == [50, 100, 150]
+        assert len(rf_test) == 3
+        assert all(isinstance(mse, float) for mse in rf_train + rf_test)
+        assert q_train == [None, None, None]
+        assert q_test == [None, None, None]
+        # Later sizes are skipped once the quantum fit has failed
+        assert calls == [50]
+
+
+class TestLoadNumericCsv:
+    """Tests for load_numeric_csv."""
+
+    def test_pyarrow_and_pandas_paths_agree(self, monkeypatch, tmp_path):
+        pytest.importorskip("pyarrow")
+        path = tmp_path / "weather.csv"
+        path.write_text(
+            "date,station,rain,flag,temp\n"
+            "2024-01-01,A,1,True,20.5\n"
+            "2024-01-02,B,2,False,\n"
+            "2024-01-03,C,3,True,22.0\n"
+        )
+
+        results = {}
+        for engine in ("pyarrow", "c"):
+            monkeypatch.setattr(qas, "CSV_ENGINE", engine)
+            results[engine] = qas.load_numeric_csv(str(path))
+
+        (X_pa, y_pa), (X_pd, y_pd) = results["pyarrow"], results["c"]
+        np.testing.assert_array_equal(X_pa, X_pd)
+        np.testing.assert_array_equal(y_pa, y_pd)
+        # rain and the boolean flag are features; the NaN temp row is dropped
+        np.testing.assert_array_equal(X_pa, [[1.0, 1.0], [3.0, 1.0]])
+        np.testing.assert_array_equal(y_pa, [20.5, 22.0])
@@ -0,0 +1,38 @@
+"""
+Unit tests for helper functions in services.soilscan_ai.app.
+"""
+
+import time
+import uuid
+
+from services.soilscan_ai.app import _score_metrics, _uuid7
+
+
+class TestUuid7:
+    """Tests for the UUIDv7 analysis ID generator."""
+
+    def test_version_is_7(self):
+        assert _uuid7().version == 7
+
+    def test_variant_is_rfc_4122(self):
+        assert _uuid7().variant == uuid.RFC_4122
+
+    def test_timestamp_is_current_unix_ms(self):
+        before = time.time_ns() // 1_000_000
+        value = _uuid7()
+        after = time.time_ns() // 1_000_000
+
+        assert before <= value.int >> 80 <= after
+
+    def test_ids_are_unique(self):
+        assert len({_uuid7() for _ in range(1000)}) == 1000
+
+
+class TestScoreMetrics:
+    """Tests for the weighted soil health score."""
+
+    def test_health_score_uses_numpy_rounding(self):
+        # The raw weighted score is 25.945 here; numpy rounds it to 25.94
+        # where builtin round() would give 25.95.
+        _, health_score = _score_metrics((48.4, 133.1, 288.6, 284.5, 374.6, 168.8))
+        assert health_score == 25.94
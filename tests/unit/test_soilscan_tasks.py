@@ -0,0 +1,85 @@
+"""
+Unit tests for services.soilscan_ai.tasks — Celery task bodies.
+"""
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+
+from services.soilscan_ai.tasks import (
+    REPORT_CACHE_TTL_SECONDS,
+    analyze_satellite_imagery,
+    generate_soil_report,
+)
+
+
+@pytest.fixture()
+def mock_redis():
+    """Patch the worker's Redis client with a MagicMock."""
+    client = MagicMock()
+    with patch("services.soilscan_ai.tasks.get_redis", return_value=client):
+        yield client
+
+
+class TestAnalyzeSatelliteImagery:
+    """Tests for the per-worker model cache on analyze_satellite_imagery."""
+
+    def test_model_loaded_once_per_worker(self, monkeypatch):
+        monkeypatch.setattr(analyze_satellite_imagery, "_model", None)
+        monkeypatch.setattr(
+            "services.soilscan_ai.tasks.settings.SOILSCAN_MODEL_PATH", "model.joblib"
+        )
+        with patch(
+            "services.soilscan_ai.tasks.joblib.load", return_value=object()
+        ) as load:
+            first = analyze_satellite_imagery("plot-1", "s3://a.tif")
+            second = analyze_satellite_imagery("plot-2", "s3://b.tif")
+
+        assert first["model_loaded"] and second["model_loaded"]
+        load.assert_called_once_with("model.joblib")
+
+    def test_no_model_path_skips_loading(self, monkeypatch):
+        monkeypatch.setattr(analyze_satellite_imagery, "_model", None)
+        monkeypatch.setattr(
+            "services.soilscan_ai.tasks.settings.SOILSCAN_MODEL_PATH", None
+        )
+        with patch("services.soilscan_ai.tasks.joblib.load") as load:
+            result = analyze_satellite_imagery("plot-1", "s3://a.tif")
+
+        assert result["model_loaded"] is False
+        load.assert_not_called()
+
+
+class TestGenerateSoilReport:
+    """Tests for the Redis cache-aside in generate_soil_report."""
+
+    def test_cache_hit_returns_cached_report(self, mock_redis):
+        cached = {"status": "completed", "analysis_id": "a-1", "report_format": "pdf"}
+        mock_redis.get.return_value = json.dumps(cached).encode()
+
+        assert generate_soil_report("a-1") == cached
+        mock_redis.get.assert_called_once_with("reports:a-1")
+        mock_redis.setex.assert_not_called()
+
+    def test_cache_miss_generates_and_caches(self, mock_redis):
+        mock_redis.get.return_value = None
+
+        result = generate_soil_report("a-2")
+
+        assert result["status"] == "completed"
+        assert result["analysis_id"] == "a-2"
+        mock_redis.setex.assert_called_once_with(
+            "reports:a-2", REPORT_CACHE_TTL_SECONDS, json.dumps(result)
+        )
+
+    def test_redis_down_still_generates_report(self, mock_redis):
+        mock_redis.get.side_effect = redis.ConnectionError("connection refused")
+        mock_redis.setex.side_effect = redis.ConnectionError("connection refused")
+
+        result = generate_soil_report("a-3")
+
+        assert result["status"] == "completed"
+        assert result["analysis_id"] == "a-3"
+        mock_redis.setex.assert_called_once()